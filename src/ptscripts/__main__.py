@@ -6,7 +6,8 @@ import pathlib
 import sys
 from typing import NoReturn
 
-from ptscripts.parser import Parser
+from ptscripts.parser import __version__
+from ptscripts.parser import get_parser
 
 CWD: pathlib.Path = pathlib.Path.cwd()
 if "TOOLS_SCRIPTS_PATH" in os.environ:
@@ -26,7 +27,11 @@ def main() -> NoReturn:  # type: ignore[misc]
     """
     Main CLI entry-point for python tools scripts.
     """
-    parser = Parser()
+    if sys.argv[1:] == ["--version"]:
+        # Short circuit, there's no need to discover the tools just to print the version
+        print(__version__)  # noqa: T201
+        sys.exit(0)
+    parser = get_parser()
     cwd = str(parser.repo_root)
     log.debug("Searching for tools in %s", cwd)
     if cwd in sys.path:
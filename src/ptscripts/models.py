@@ -11,7 +11,7 @@ from pydantic import BaseModel
 from pydantic import Field
 
 from ptscripts.utils import cast_to_pathlib_path
-from ptscripts.utils import file_digest
+from ptscripts.utils import file_digests
 
 if TYPE_CHECKING:
     from ptscripts.parser import Context
@@ -28,19 +28,26 @@ class _PipMixin(BaseModel):
     pip_requirement: str = Field(default="pip>=22.3.1,<23.0")
     setuptools_requirement: str = Field(default="setuptools>=65.6.3,<66")
 
-    def _get_config_hash(self) -> bytes:
+    def _get_config_files(self) -> list[pathlib.Path]:
+        """
+        Return the files whose contents are part of the configuration hash.
+        """
+        return [cast_to_pathlib_path(fpath) for fpath in sorted(self.requirements_files)]
+
+    def _get_config_hash(self, *, include_files: bool = True) -> bytes:
         """
         Return a hash digest of the configuration.
         """
-        config_hash = hashlib.sha256()
+        config_hash = hashlib.blake2b()
         config_hash.update(self.pip_requirement.encode())
         config_hash.update(self.setuptools_requirement.encode())
         for argument in self.install_args:
             config_hash.update(argument.encode())
         for requirement in sorted(self.requirements):
             config_hash.update(requirement.encode())
-        for fpath in sorted(self.requirements_files):
-            config_hash.update(file_digest(cast_to_pathlib_path(fpath)))
+        if include_files:
+            for digest in file_digests(self._get_config_files()):
+                config_hash.update(digest)
         return config_hash.digest()
 
     def _install(self, ctx: Context, python_executable: str | None = None) -> None:
@@ -92,22 +99,29 @@ class _PoetryMixin(BaseModel):
     install_args: list[str] = Field(default_factory=list)
     poetry_requirement: str = Field(default="poetry>=1.8.0")
 
-    def _get_config_hash(self) -> bytes:
+    def _get_config_files(self) -> list[pathlib.Path]:
+        """
+        Return the files whose contents are part of the configuration hash.
+        """
+        # Late import to avoid circular import errors
+        from ptscripts.__main__ import CWD
+
+        return [CWD / "poetry.lock"]
+
+    def _get_config_hash(self, *, include_files: bool = True) -> bytes:
         """
         Return a hash of the configuration.
         """
-        config_hash = hashlib.sha256()
+        config_hash = hashlib.blake2b()
         config_hash.update(self.poetry_requirement.encode())
         config_hash.update(str(self.no_root).encode())
         for argument in self.install_args:
             config_hash.update(argument.encode())
         for group in self.groups:
             config_hash.update(group.encode())
-
-        # Late import to avoid circular import errors
-        from ptscripts.__main__ import CWD
-
-        config_hash.update(file_digest(CWD / "poetry.lock"))
+        if include_files:
+            for digest in file_digests(self._get_config_files()):
+                config_hash.update(digest)
         return config_hash.digest()
 
     def _install(self, ctx: Context, python_executable: str | None = None) -> None:
@@ -174,9 +188,9 @@ class DefaultConfig(_LockTimeoutMixin, BaseModel):
     @cached_property
     def config_hash(self) -> str:
         """
-        Returns a sha256 hash of the requirements.
+        Returns a BLAKE2b hash of the requirements.
         """
-        config_hash = hashlib.sha256()
+        config_hash = hashlib.blake2b()
         # The first part of the hash should be the path to the tools executable
         config_hash.update(sys.argv[0].encode())
         # The second, TOOLS_VIRTUALENV_CACHE_SEED env variable, if set
@@ -234,8 +248,15 @@ class VirtualEnvConfig(_LockTimeoutMixin, BaseModel):
     env: dict[str, str] = Field(default=None)
     system_site_packages: bool = Field(default=False)
     add_as_extra_site_packages: bool = Field(default=False)
+    require_lock: bool = Field(default=True)
 
-    def _get_config_hash(self) -> bytes:
+    def _get_config_files(self) -> list[pathlib.Path]:
+        """
+        Return the files whose contents are part of the configuration hash.
+        """
+        raise NotImplementedError
+
+    def _get_config_hash(self, *, include_files: bool = True) -> bytes:
         """
         Return a hash of the configuration.
         """
@@ -253,17 +274,26 @@ class VirtualEnvConfig(_LockTimeoutMixin, BaseModel):
         """
         raise NotImplementedError
 
-    def get_config_hash(self) -> str:
+    def get_config_files(self) -> list[pathlib.Path]:
+        """
+        Return the files whose contents are part of the configuration hash.
+        """
+        return self._get_config_files()
+
+    def get_config_hash(self, *, include_files: bool = True) -> str:
         """
         Return a hash digest of the configuration.
+
+        When ``include_files`` is ``False``, the contents of the files returned by
+        :py:meth:`get_config_files` are left out of the hash.
         """
-        config_hash = hashlib.sha256()
+        config_hash = hashlib.blake2b()
         # The first part of the hash should be the path to the tools executable
         config_hash.update(sys.argv[0].encode())
         # The second, TOOLS_VIRTUALENV_CACHE_SEED env variable, if set
         hash_seed = os.environ.get("TOOLS_VIRTUALENV_CACHE_SEED", "")
         config_hash.update(hash_seed.encode())
-        config_hash.update(self._get_config_hash())
+        config_hash.update(self._get_config_hash(include_files=include_files))
         return config_hash.hexdigest()
 
     def install(self, ctx: Context, python_executable: str | None = None) -> None:
@@ -15,6 +15,8 @@ import typing
 from contextlib import AbstractContextManager
 from contextlib import contextmanager
 from contextlib import nullcontext
+from functools import cache
+from functools import cached_property
 from functools import partial
 from subprocess import CompletedProcess
 from types import FunctionType
@@ -27,15 +29,8 @@ from typing import TypeVar
 from typing import cast
 
 import requests
-import rich
-from rich.console import Console
-from rich.theme import Theme
 
 from ptscripts import logs
-from ptscripts import process
-from ptscripts.models import VirtualEnvConfig
-from ptscripts.models import VirtualEnvPipConfig
-from ptscripts.virtualenv import VirtualEnv
 
 if sys.version_info < (3, 10):
     from typing_extensions import Concatenate
@@ -65,8 +60,14 @@ if TYPE_CHECKING:
     from argparse import Namespace
     from argparse import _SubParsersAction
     from collections.abc import Iterator
+    from collections.abc import Sequence
+
+    from rich.console import Console
+    from rich.theme import Theme
 
     from ptscripts.models import DefaultConfig
+    from ptscripts.models import VirtualEnvConfig
+    from ptscripts.virtualenv import VirtualEnv
 
 
 Param = ParamSpec("Param")
@@ -76,6 +77,80 @@ DecoratedFunc = Callable[Concatenate[str, Param], RetType]
 
 log = logging.getLogger(__name__)
 
+# The argparse action to use for boolean keyword arguments, keyed by their default value
+_BOOL_ACTION: dict[bool, str] = {True: "store_false", False: "store_true"}
+
+
+_THEME_SPEC: dict[str, str] = {
+    "log-debug": "dim blue",
+    "log-info": "dim cyan",
+    "log-warning": "magenta",
+    "log-error": "bold red",
+    "exit-ok": "green",
+    "exit-failure": "bold red",
+    "logging.level.stdout": "dim blue",
+    "logging.level.stderr": "dim red",
+}
+
+
+@cache
+def _get_theme() -> Theme:
+    """
+    Return the rich theme used by the tools consoles, creating it on the first call.
+    """
+    from rich.theme import Theme
+
+    return Theme(_THEME_SPEC)
+
+
+def _new_virtualenv(ctx: Context, config: VirtualEnvConfig) -> VirtualEnv:
+    """
+    Return a new virtual environment.
+
+    The virtualenv machinery is only imported when a virtual environment is actually used.
+    """
+    from ptscripts.virtualenv import VirtualEnv
+
+    return VirtualEnv(ctx=ctx, config=config)
+
+
+@cache
+def _get_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """
+    Return the cached signature of a decorated command function.
+
+    The signature is needed to setup the command parser and again to call the function.
+    """
+    return inspect.signature(func)
+
+
+def _get_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """
+    Return the type annotations of a decorated command function.
+
+    ``typing.get_type_hints`` is only needed to resolve string annotations, for example, when the
+    function's module uses ``from __future__ import annotations``.
+    """
+    annotations: dict[str, Any] = func.__annotations__
+    if any(isinstance(annotation, str) for annotation in annotations.values()):
+        return typing.get_type_hints(func)
+    return annotations
+
+
+@cache
+def _get_call_plan(func: Callable[..., Any]) -> tuple[tuple[str, bool], ...]:
+    """
+    Return the cached ``(name, is_positional)`` pairs of the CLI parsed function arguments.
+
+    The first argument, ``ctx``, and arguments without type annotations are not parsed from the CLI.
+    """
+    params = tuple(_get_signature(func).parameters.values())
+    return tuple(
+        (parameter.name, parameter.default is parameter.empty)
+        for parameter in params[1:]
+        if parameter.annotation is not parameter.empty
+    )
+
 
 class ArgumentOptions(TypedDict):
     """
@@ -102,6 +177,34 @@ class FullArgumentOptions(ArgumentOptions):
     type: type[Any]
 
 
+class _DeferredArgumentParser(argparse.ArgumentParser):
+    """
+    Argument parser which defers adding its arguments until it's used to parse the CLI.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._deferred_setup: Callable[[ArgumentParser], None] | None = None
+
+    def defer(self, setup: Callable[[ArgumentParser], None]) -> None:
+        """
+        Register a callable which sets up the parser arguments when it's first used.
+        """
+        self._deferred_setup = setup
+
+    def parse_known_args(  # type: ignore[override]
+        self, args: Sequence[str] | None = None, namespace: Namespace | None = None
+    ) -> tuple[Namespace, list[str]]:
+        """
+        Run the deferred parser setup, if any, prior to parsing.
+        """
+        setup = self._deferred_setup
+        if setup is not None:
+            self._deferred_setup = None
+            setup(self)
+        return super().parse_known_args(args, namespace)
+
+
 class Context:
     """
     Context class passed to every command group function as the first argument.
@@ -112,28 +215,44 @@ class Context:
         self._quiet = quiet
         self._debug = debug
         self.repo_root = parser.repo_root
-        theme = Theme(
-            {
-                "log-debug": "dim blue",
-                "log-info": "dim cyan",
-                "log-warning": "magenta",
-                "log-error": "bold red",
-                "exit-ok": "green",
-                "exit-failure": "bold red",
-                "logging.level.stdout": "dim blue",
-                "logging.level.stderr": "dim red",
-            }
-        )
-        console_kwargs = {
-            "theme": theme,
+        self.venv = None
+
+    @cached_property
+    def _console_kwargs(self) -> dict[str, Any]:
+        """
+        Keyword arguments shared by all rich consoles.
+
+        Rich is only imported, and its global console reconfigured, the first time
+        a console is needed.
+        """
+        import rich
+
+        console_kwargs: dict[str, Any] = {
+            "theme": _get_theme(),
         }
         if os.environ.get("CI"):
             console_kwargs["force_terminal"] = True
             console_kwargs["force_interactive"] = False
-        self.console = Console(stderr=True, log_path=False, **console_kwargs)
-        self.console_stdout = Console(log_path=False, **console_kwargs)
         rich.reconfigure(stderr=True, **console_kwargs)
-        self.venv = None
+        return console_kwargs
+
+    @cached_property
+    def console(self) -> Console:
+        """
+        Rich console which prints to stderr.
+        """
+        from rich.console import Console
+
+        return Console(stderr=True, log_path=False, **self._console_kwargs)
+
+    @cached_property
+    def console_stdout(self) -> Console:
+        """
+        Rich console which prints to stdout.
+        """
+        from rich.console import Console
+
+        return Console(log_path=False, **self._console_kwargs)
 
     def print(self, *args, **kwargs) -> None:
         """
@@ -167,7 +286,7 @@ class Context:
         """
         self.console.log(*args, style="log-error", _stack_offset=2)
 
-    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:  # type: ignore[misc]
+    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:
         """
         Exit the command execution.
         """
@@ -192,6 +311,9 @@ class Context:
         """
         Run a subprocess.
         """
+        # Late import to only load the asyncio subprocess machinery when it's actually used
+        from ptscripts import process
+
         return process.run(
             *cmdline,
             check=check,
@@ -217,7 +339,8 @@ class Context:
 
         Either in a virtualenv context if one was configured or the system context.
         """
-        self.debug(f"""Running '{" ".join(cmdline)}'""")
+        if self._debug:
+            self.debug(f"""Running '{" ".join(cmdline)}'""")
         try:
             if self.venv:
                 return self.venv.run(
@@ -250,26 +373,29 @@ class Context:
         """
         Change the current working directory to the provided path.
         """
-        cwd = pathlib.Path.cwd()
+        cwd = os.getcwd()  # noqa: PTH109
         try:
             os.chdir(path)
             yield path
         finally:
-            if not cwd.exists():
-                self.error(f"Unable to change back to path {cwd}")
-            else:
+            try:
                 os.chdir(cwd)
+            except FileNotFoundError:
+                self.error(f"Unable to change back to path {cwd}")
 
     @contextmanager
     def virtualenv(self, name: str, config: VirtualEnvConfig | None = None) -> Iterator[VirtualEnv]:
         """
         Create and use a virtual environment.
         """
+        # Late import to only load the virtualenv machinery when it's actually used
+        from ptscripts.models import VirtualEnvPipConfig
+
         if config is None:
             config = VirtualEnvPipConfig(name=name)
         if config.name is None:
             config.name = name
-        with VirtualEnv(ctx=self, config=config) as venv:
+        with _new_virtualenv(self, config) as venv:
             yield venv
 
     @property
@@ -376,103 +502,100 @@ class RegisteredImports:
 
 class Parser:
     """
-    Singleton parser class that wraps argparse.
+    Parser class that wraps argparse.
+
+    Use :py:func:`get_parser` to get the parser instance.
     """
 
-    _instance: Parser | None = None
+    __slots__ = ("parser", "subparsers", "context", "repo_root", "options")
+
     parser: ArgumentParser
     subparsers: _SubParsersAction[ArgumentParser]
     context: Context
     repo_root: pathlib.Path
+    options: Namespace
+
+    def __init__(self) -> None:
+        # Let's do a litle manual parsing so that we can set debug or quiet early
+        debug = False
+        quiet = False
+        for arg in sys.argv[1:]:
+            if not arg.startswith("-"):
+                break
+            if arg in ("-q", "--quiet"):
+                quiet = True
+                break
+            if arg in ("-d", "--debug"):
+                debug = True
+                break
+        self.repo_root = pathlib.Path.cwd()
+        self.context = Context(self, debug=debug, quiet=quiet)
+        self.parser = argparse.ArgumentParser(
+            prog="tools",
+            description="Python Tools Scripts",
+            epilog="These tools are discovered under `<repo-root>/tools`.",
+            allow_abbrev=False,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+        self.parser.add_argument("--version", action="version", version=__version__)
+        log_group = self.parser.add_argument_group("Logging")
+        timestamp_meg = log_group.add_mutually_exclusive_group()
+        timestamp_meg.add_argument(
+            "--timestamps",
+            "--ts",
+            action="store_true",
+            help="Add time stamps to logs",
+            dest="timestamps",
+        )
+        timestamp_meg.add_argument(
+            "--no-timestamps",
+            "--nts",
+            action="store_false",
+            default=True,
+            help="Remove time stamps from logs",
+            dest="timestamps",
+        )
+        level_group = log_group.add_mutually_exclusive_group()
+        level_group.add_argument(
+            "--quiet",
+            "-q",
+            dest="quiet",
+            action="store_true",
+            default=False,
+            help="Disable logging",
+        )
+        level_group.add_argument(
+            "--debug",
+            "-d",
+            action="store_true",
+            default=False,
+            help="Show debug messages",
+        )
+        run_options = self.parser.add_argument_group(
+            "Run Subprocess Options", description="These options apply to ctx.run() calls"
+        )
+        run_options.add_argument(
+            "--timeout",
+            "--timeout-secs",
+            default=None,
+            type=int,
+            help="Timeout in seconds for the command to finish.",
+            metavar="SECONDS",
+            dest="timeout_secs",
+        )
+        run_options.add_argument(
+            "--no-output-timeout-secs",
+            "--nots",
+            default=None,
+            type=int,
+            help="Timeout if no output has been seen for the provided seconds.",
+            metavar="SECONDS",
+            dest="no_output_timeout_secs",
+        )
 
-    def __new__(cls) -> Parser:
-        """
-        Method that instantiates a singleton class and returns it.
-        """
-        if cls._instance is None:
-            # Let's do a litle manual parsing so that we can set debug or quiet early
-            debug = False
-            quiet = False
-            for arg in sys.argv[1:]:
-                if not arg.startswith("-"):
-                    break
-                if arg in ("-q", "--quiet"):
-                    quiet = True
-                    break
-                if arg in ("-d", "--debug"):
-                    debug = True
-                    break
-            instance = super().__new__(cls)
-            instance.repo_root = pathlib.Path.cwd()
-            instance.context = Context(instance, debug=debug, quiet=quiet)
-            instance.parser = argparse.ArgumentParser(
-                prog="tools",
-                description="Python Tools Scripts",
-                epilog="These tools are discovered under `<repo-root>/tools`.",
-                allow_abbrev=False,
-                formatter_class=argparse.RawDescriptionHelpFormatter,
-            )
-            instance.parser.add_argument("--version", action="version", version=__version__)
-            log_group = instance.parser.add_argument_group("Logging")
-            timestamp_meg = log_group.add_mutually_exclusive_group()
-            timestamp_meg.add_argument(
-                "--timestamps",
-                "--ts",
-                action="store_true",
-                help="Add time stamps to logs",
-                dest="timestamps",
-            )
-            timestamp_meg.add_argument(
-                "--no-timestamps",
-                "--nts",
-                action="store_false",
-                default=True,
-                help="Remove time stamps from logs",
-                dest="timestamps",
-            )
-            level_group = log_group.add_mutually_exclusive_group()
-            level_group.add_argument(
-                "--quiet",
-                "-q",
-                dest="quiet",
-                action="store_true",
-                default=False,
-                help="Disable logging",
-            )
-            level_group.add_argument(
-                "--debug",
-                "-d",
-                action="store_true",
-                default=False,
-                help="Show debug messages",
-            )
-            run_options = instance.parser.add_argument_group(
-                "Run Subprocess Options", description="These options apply to ctx.run() calls"
-            )
-            run_options.add_argument(
-                "--timeout",
-                "--timeout-secs",
-                default=None,
-                type=int,
-                help="Timeout in seconds for the command to finish.",
-                metavar="SECONDS",
-                dest="timeout_secs",
-            )
-            run_options.add_argument(
-                "--no-output-timeout-secs",
-                "--nots",
-                default=None,
-                type=int,
-                help="Timeout if no output has been seen for the provided seconds.",
-                metavar="SECONDS",
-                dest="no_output_timeout_secs",
-            )
-
-            instance.subparsers = instance.parser.add_subparsers(
-                title="Commands", dest="command", required=True
-            )
-            cls._instance = instance
-        return cls._instance
+        self.subparsers = self.parser.add_subparsers(
+            title="Commands", dest="command", required=True
+        )
 
     def _process_registered_tool_modules(self) -> None:
         default_config = DefaultToolsPythonRequirements().config
@@ -485,7 +608,7 @@ class Parser:
             if not default_venv_config.name:
                 default_venv_config.name = "default"
             default_venv_config.add_as_extra_site_packages = True
-            default_venv = VirtualEnv(ctx=self.context, config=default_venv_config)
+            default_venv = _new_virtualenv(self.context, default_venv_config)
         else:
             default_venv = nullcontext()
         with default_venv:
@@ -494,7 +617,7 @@ class Parser:
                 if venv_config:
                     if not venv_config.name:
                         venv_config.name = module_name
-                    venv = VirtualEnv(ctx=self.context, config=venv_config)
+                    venv = _new_virtualenv(self.context, venv_config)
                 else:
                     venv = nullcontext()
                 with venv:
@@ -511,7 +634,8 @@ class Parser:
         Parse CLI.
         """
         # Log the argv getting executed
-        self.context.debug(f"Tools executing 'sys.argv': {sys.argv}")
+        if self.context._debug:
+            self.context.debug(f"Tools executing 'sys.argv': {sys.argv}")
         # Process registered imports to allow other modules to register commands
         self._process_registered_tool_modules()
         options = self.parser.parse_args()
@@ -523,8 +647,8 @@ class Parser:
             self.context._quiet = False
             self.context._debug = True
             logging.root.setLevel(logging.DEBUG)
-            self.context.console.log_path = True
-            self.context.console_stdout.log_path = True
+            self.context.console.log_path = True  # type: ignore[attr-defined]
+            self.context.console_stdout.log_path = True  # type: ignore[attr-defined]
         else:
             self.context._quiet = False
             self.context._debug = False
@@ -536,18 +660,42 @@ class Parser:
             for handler in logging.root.handlers:
                 handler.setFormatter(logs.NO_TIMESTAMP_FORMATTER)
         self.options = options
-        if "func" not in options:
+        if getattr(options, "func", None) is None:
             self.context.exit(1, "No command was passed.")
-        log.debug("CLI parsed options %s", options)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("CLI parsed options %s", options)
         options.func(options)
 
-    def __getattr__(self, attr: str) -> Any:  # noqa: ANN401
+    def add_argument(self, *args, **kwargs) -> argparse.Action:
+        """
+        Proxy to the parser instance ``add_argument`` method.
+        """
+        return self.parser.add_argument(*args, **kwargs)
+
+    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:
+        """
+        Proxy to the parser instance ``exit`` method.
+        """
+        self.parser.exit(status, message)
+
+    def error(self, message: str) -> NoReturn:
         """
-        Proxy unknown attributes to the parser instance.
+        Proxy to the parser instance ``error`` method.
         """
-        if attr == "options":
-            return self.__getattribute__(attr)
-        return getattr(self.parser, attr)
+        self.parser.error(message)
+
+
+_PARSER: Parser | None = None
+
+
+def get_parser() -> Parser:
+    """
+    Return the parser instance, creating it on the first call.
+    """
+    global _PARSER  # noqa: PLW0603
+    if _PARSER is None:
+        _PARSER = Parser()
+    return _PARSER
 
 
 class GroupReference:
@@ -592,6 +740,16 @@ class CommandGroup:
     Command group which holds the available tool functions.
     """
 
+    __slots__ = (
+        "name",
+        "_dash_name",
+        "_snake_name",
+        "venv_config",
+        "parser",
+        "subparsers",
+        "context",
+    )
+
     def __init__(
         self,
         name: str,
@@ -601,10 +759,12 @@ class CommandGroup:
         venv_config: VirtualEnvConfig | None = None,
     ) -> None:
         self.name = name
+        self._dash_name = name.replace("_", "-")
+        self._snake_name = name.replace("-", "_")
         if description is None:
             description = help
         if parent is None:
-            parent = Parser()
+            parent = get_parser()
             GroupReference.add_command((name,), self)
         # We can also pass a string or list of strings that specify the parent commands.
         # This should help avoid circular imports
@@ -623,18 +783,19 @@ class CommandGroup:
         if TYPE_CHECKING:
             assert parent
         self.parser = parent.subparsers.add_parser(  # type: ignore[union-attr, has-type]
-            name.replace("_", "-"),
+            self._dash_name,
             help=help,
             description=description,
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
         self.subparsers = self.parser.add_subparsers(
             title="Commands",
-            dest=f"{name.replace('-', '_')}_command",
+            dest=f"{self._snake_name}_command",
+            parser_class=_DeferredArgumentParser,
         )
         self.context = parent.context  # type: ignore[union-attr, has-type]
 
-    def command(  # noqa: ANN201,C901,PLR0912,PLR0915
+    def command(  # noqa: ANN201
         self,
         func: FunctionType | None = None,
         *,
@@ -657,30 +818,56 @@ class CommandGroup:
                 venv_config=venv_config,
             )
 
-        func_name = func.__name__
-        func_file = sys.modules[func.__module__].__file__
-        if TYPE_CHECKING:
-            assert func_file
-        func_path = str(pathlib.Path(func_file).relative_to(self.context.repo_root))
-
         if name is None:
-            name = func_name
+            name = func.__name__
+
+        # Cheap, and it makes mistakes in the decorated function surface right away
+        arguments = self._check_command_signature(func, arguments)
 
         if description is None:
             description = inspect.getdoc(func)
         if help is None and description is not None:
             help = description.splitlines()[0]
-        command = self.subparsers.add_parser(
-            name=name,
-            help=help,
-            description=description,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
+        command = cast(
+            _DeferredArgumentParser,
+            self.subparsers.add_parser(
+                name=name,
+                help=help,
+                description=description,
+                formatter_class=argparse.RawDescriptionHelpFormatter,
+            ),
+        )
+        # Wiring up the command arguments is only done if the command is actually selected
+        command.defer(
+            partial(
+                self._setup_command,
+                func,
+                name=name,
+                arguments=arguments,
+                venv_config=venv_config,
+            )
         )
+        return func
+
+    def _check_command_signature(
+        self, func: FunctionType, arguments: dict[str, ArgumentOptions] | None
+    ) -> dict[str, ArgumentOptions]:
+        """
+        Check the decorated function signature against the passed ``arguments``.
 
-        signature = inspect.signature(func)
+        Return the ``arguments`` to setup the command parser with.
+        """
+        func_name = func.__name__
+        func_file = sys.modules[func.__module__].__file__
+        if TYPE_CHECKING:
+            assert func_file
+        func_path = str(pathlib.Path(func_file).relative_to(self.context.repo_root))
+
+        params = tuple(_get_signature(func).parameters.values())
+        param_names = frozenset(parameter.name for parameter in params)
 
         if arguments is None:
-            if len(signature.parameters) > 1:
+            if len(params) > 1:
                 msg = (
                     f"'arguments' is a mandatory keyword argument to the '@{self.name}.command' "
                     "decorator when additional arguments(besides the required 'ctx' as first "
@@ -691,7 +878,7 @@ class CommandGroup:
             arguments = {}
 
         for key in arguments:
-            if key not in signature.parameters:
+            if key not in param_names:
                 msg = (
                     "Only pass argument names or keyword argument names on the 'arguments' keyword "
                     f"for the '@{self.name}.command' decorated function {func_name!r} in {func_path!r} "
@@ -699,18 +886,30 @@ class CommandGroup:
                 )
                 raise RuntimeError(msg)
 
-        type_annotation = typing.get_type_hints(func)
-        first_parameter_seen = False
-        for parameter in signature.parameters.values():
-            if first_parameter_seen is False:
-                first_parameter_seen = True
-                if parameter.name != "ctx":
-                    msg = (
-                        f"'ctx' is a mandatory first argument to the '@{self.name}.command' "
-                        f"decorated function {func_name!r} in {func_path!r}."
-                    )
-                    raise RuntimeError(msg)
-                continue
+        if params and params[0].name != "ctx":
+            msg = (
+                f"'ctx' is a mandatory first argument to the '@{self.name}.command' "
+                f"decorated function {func_name!r} in {func_path!r}."
+            )
+            raise RuntimeError(msg)
+        return arguments
+
+    def _setup_command(
+        self,
+        func: FunctionType,
+        command: ArgumentParser,
+        *,
+        name: str,
+        arguments: dict[str, ArgumentOptions],
+        venv_config: VirtualEnvConfig | None,
+    ) -> None:
+        """
+        Add the decorated function arguments to its command parser.
+        """
+        params = tuple(_get_signature(func).parameters.values())
+        type_annotation = _get_type_hints(func)
+        # The first parameter, ``ctx``, is not parsed from the CLI
+        for parameter in params[1:]:
             if parameter.annotation is parameter.empty:
                 # No typing annotations
                 continue
@@ -723,9 +922,9 @@ class CommandGroup:
                 # Let's unwrap it to the inner type, which, for the example
                 # here is, list[str]
                 param_type = param_type_args[0]
-
-            if isinstance(param_type, GenericAlias):
-                param_type = typing.get_args(param_type)[0]
+                if isinstance(param_type, GenericAlias):
+                    # And now unwrap list[str] to str
+                    param_type = typing.get_args(param_type)[0]
 
             kwargs = cast(FullArgumentOptions, arguments.get(parameter.name) or {})
             if parameter.default is parameter.empty:
@@ -746,11 +945,7 @@ class CommandGroup:
                 if param_type is not bool:
                     kwargs["type"] = param_type
                 elif "action" not in kwargs:
-                    action = None
-                    if parameter.default is True:
-                        action = "store_false"
-                    elif parameter.default is False:
-                        action = "store_true"
+                    action = _BOOL_ACTION.get(parameter.default)
                     if action is not None:
                         kwargs["action"] = action
 
@@ -762,17 +957,29 @@ class CommandGroup:
             flags = kwargs.pop("flags", None)
             if flags is None:
                 flags = [f"--{parameter.name.replace('_', '-')}"]
-            log.debug("Adding Command %r. Flags: %s; KwArgs: %s", name, flags, kwargs)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Adding Command %r. Flags: %s; KwArgs: %s", name, flags, kwargs)
             command.add_argument(*flags, **kwargs)  # type: ignore[arg-type]
 
         command.set_defaults(func=partial(self, func, venv_config=venv_config))
-        return func
 
-    def __getattr__(self, attr: str) -> Any:  # noqa: ANN401
+    def add_argument(self, *args, **kwargs) -> argparse.Action:
+        """
+        Proxy to the parser instance ``add_argument`` method.
+        """
+        return self.parser.add_argument(*args, **kwargs)
+
+    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:  # type: ignore[misc]
+        """
+        Proxy to the parser instance ``exit`` method.
+        """
+        self.parser.exit(status, message)
+
+    def error(self, message: str) -> NoReturn:  # type: ignore[misc]
         """
-        Proxy unknown attributes to the parser instance.
+        Proxy to the parser instance ``error`` method.
         """
-        return getattr(self.parser, attr)
+        self.parser.error(message)
 
     def __call__(
         self,
@@ -783,37 +990,31 @@ class CommandGroup:
         """
         Execute the selected tool function.
         """
-        signature = inspect.signature(func)
         args = []
         kwargs = {}
-        for name, parameter in signature.parameters.items():
-            if parameter.annotation is parameter.empty:
-                # No typing annotations
-                continue
-            if name in options:
-                if parameter.default is parameter.empty:
-                    args.append(getattr(options, name))
-                else:
-                    kwargs[name] = getattr(options, name)
+        for name, is_positional in _get_call_plan(func):
+            if is_positional:
+                args.append(getattr(options, name))
+            else:
+                kwargs[name] = getattr(options, name)
 
-        bound = signature.bind_partial(*args, **kwargs)
         venv: VirtualEnv | None = None
         if venv_config:
             if venv_config.name is None:
-                venv_config.name = getattr(options, f"{self.name}_command")
-            venv = VirtualEnv(ctx=self.context, config=venv_config)
+                venv_config.name = getattr(options, f"{self._snake_name}_command")
+            venv = _new_virtualenv(self.context, venv_config)
         elif self.venv_config:
-            venv = VirtualEnv(ctx=self.context, config=self.venv_config)
+            venv = _new_virtualenv(self.context, self.venv_config)
         if venv:
             with venv:
                 previous_venv = self.context.venv
                 try:
                     self.context.venv = venv
-                    func(self.context, *bound.args, **bound.kwargs)
+                    func(self.context, *args, **kwargs)
                 finally:
                     self.context.venv = previous_venv
         else:
-            func(self.context, *bound.args, **bound.kwargs)
+            func(self.context, *args, **kwargs)
 
 
 def command_group(
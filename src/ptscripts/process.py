@@ -3,24 +3,45 @@ from __future__ import annotations
 import asyncio.events
 import asyncio.streams
 import asyncio.subprocess
+import atexit
 import contextlib
 import logging
 import os
 import signal
 import subprocess
 import sys
-from datetime import datetime
+import threading
 from datetime import timedelta
-from datetime import timezone
 from functools import partial
 from typing import TYPE_CHECKING
 from typing import TextIO
-from typing import cast
 
 from . import logs
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 log = logging.getLogger(__name__)
 
+_new_event_loop: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop
+# On Python 3.11+ the stdlib loop can start subprocesses in a new process group with
+# ``process_group=0``, which keeps the ``vfork()`` fast path. uvloop does not support
+# that argument and would force a full ``fork()``, so it's only used on older pythons.
+_PROCESS_GROUP_SUPPORTED = sys.version_info >= (3, 11)
+if not _PROCESS_GROUP_SUPPORTED:
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        _new_event_loop = uvloop.new_event_loop
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+# Signal handlers can't be installed from worker threads, the processes they start are
+# tracked so that they can still be stopped, see ``terminate_worker_processes()``
+_WORKER_PROCESSES: set[Process] = set()
+_WORKER_PROCESSES_LOCK = threading.Lock()
+
 
 class Process(asyncio.subprocess.Process):  # noqa: D101
     def __init__(
@@ -85,25 +106,28 @@ class Process(asyncio.subprocess.Process):  # noqa: D101
         await task
 
     async def _check_no_output_timeout(self) -> None:
-        now = datetime.now(tz=timezone.utc)
-        self._protocol._last_write = now  # type: ignore[attr-defined]
+        loop = asyncio.get_running_loop()
+        self._protocol._last_write = loop.time()  # type: ignore[attr-defined]
+        if TYPE_CHECKING:
+            assert self._no_output_timeout_secs
+        no_output_timeout_secs = self._no_output_timeout_secs.total_seconds()
         try:
             while self.returncode is None:
-                await asyncio.sleep(1)
                 last_write = self._protocol._last_write  # type: ignore[attr-defined]
-                if TYPE_CHECKING:
-                    assert self._no_output_timeout_secs
-                if last_write + self._no_output_timeout_secs < now:
-                    try:
-                        self.terminate()
-                        log.warning(
-                            "No output on has been seen for over %s second(s). "
-                            "Terminating process.",
-                            self._no_output_timeout_secs.seconds,
-                        )
-                    except ProcessLookupError:
-                        pass
-                    break
+                remaining = last_write + no_output_timeout_secs - loop.time()
+                if remaining > 0:
+                    # Sleep until the timeout would be reached if no more output is seen
+                    await asyncio.sleep(remaining)
+                    continue
+                try:
+                    self.terminate()
+                    log.warning(
+                        "No output on has been seen for over %s second(s). Terminating process.",
+                        self._no_output_timeout_secs.seconds,
+                    )
+                except ProcessLookupError:
+                    pass
+                break
         except asyncio.CancelledError:
             pass
 
@@ -132,31 +156,43 @@ class SubprocessStreamProtocol(asyncio.subprocess.SubprocessStreamProtocol):  #
     def __init__(self, *args, capture: bool = False, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._capture: bool = capture
-        self._last_write: datetime | None = None
+        self._last_write: float | None = None
+        # Whether the output is passed through logging, which does not change while the process runs
+        self._log_mode: bool = logs.include_timestamps() or "CI" in os.environ
+        if not self._capture and not self._log_mode:
+            # The output is written to the binary buffers, flush any pending text first
+            sys.stdout.flush()
+            sys.stderr.flush()
 
     def pipe_data_received(self, fd: int, data: bytes | bytearray | str) -> None:  # noqa: D102
-        self._last_write = datetime.now(tz=timezone.utc)
+        self._last_write = self._loop.time()  # type: ignore[attr-defined]
         if self._capture:
             super().pipe_data_received(fd, data)
             return
+        if not self._log_mode:
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            stream = sys.stdout if fd == 1 else sys.stderr
+            buffer = getattr(stream, "buffer", None)
+            if buffer is None:
+                # The stream was replaced by one without an underlying binary buffer
+                stream.write(data.decode("utf-8"))
+                stream.flush()
+                return
+            # Pass the output through untouched, there's no need to decode it
+            buffer.write(data)
+            buffer.flush()
+            return
         if isinstance(data, (bytes, bytearray)):
             decoded_data = data.decode("utf-8")
         else:
             decoded_data = data
-        if logs.include_timestamps() or "CI" in os.environ:
-            if not decoded_data.strip():
-                return
-            if fd == 1:
-                log.stdout(decoded_data)  # type: ignore[attr-defined]
-            else:
-                log.stderr(decoded_data)  # type: ignore[attr-defined]
+        if not decoded_data.strip():
+            return
+        if fd == 1:
+            log.stdout(decoded_data)  # type: ignore[attr-defined]
         else:
-            if fd == 1:  # noqa: PLR5501
-                sys.stdout.write(decoded_data)
-                sys.stdout.flush()
-            else:
-                sys.stderr.write(decoded_data)
-                sys.stderr.flush()
+            log.stderr(decoded_data)  # type: ignore[attr-defined]
 
 
 async def _create_subprocess_exec(
@@ -208,20 +244,22 @@ def _handle_signal(proc: Process, sig: signal.Signals) -> None:
 
 
 async def _subprocess_run(
-    future: asyncio.Future[subprocess.CompletedProcess[bytes]],
     cmdline: list[str] | tuple[str, ...],
     timeout_secs: int | None = None,
     no_output_timeout_secs: int | None = None,
     capture: bool = False,
     interactive: bool = False,
     **kwargs,
-) -> None:
+) -> subprocess.CompletedProcess[bytes]:
     stdout = subprocess.PIPE
     stderr = subprocess.PIPE
     if interactive is False:
         # Run in a separate program group
         if sys.platform.startswith("win"):
             kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        elif _PROCESS_GROUP_SUPPORTED:
+            # Unlike a ``preexec_fn``, this still allows spawning the process with ``vfork()``
+            kwargs["process_group"] = 0
         else:
             kwargs["preexec_fn"] = os.setpgrp
     proc = await _create_subprocess_exec(
@@ -229,7 +267,6 @@ async def _subprocess_run(
         stdout=stdout,
         stderr=stderr,
         stdin=sys.stdin,
-        limit=1,
         timeout_secs=timeout_secs,
         no_output_timeout_secs=no_output_timeout_secs,
         capture=capture,
@@ -237,22 +274,60 @@ async def _subprocess_run(
     )
     proc._handled_signals = []  # type: ignore[attr-defined]
     loop = asyncio.get_running_loop()
-    for signame in ("SIGINT", "SIGTERM"):
-        sig = getattr(signal, signame)
+    signals: list[signal.Signals] = []
+    # Signal handlers can only be installed from the main thread
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if in_main_thread:
+        signals.extend(getattr(signal, signame) for signame in ("SIGINT", "SIGTERM"))
+    else:
+        with _WORKER_PROCESSES_LOCK:
+            _WORKER_PROCESSES.add(proc)
+    for sig in signals:
         with contextlib.suppress(NotImplementedError):
             loop.add_signal_handler(sig, partial(_handle_signal, proc, sig))
 
-    proc_stdout, proc_stderr = await asyncio.shield(proc.communicate())
+    try:
+        proc_stdout, proc_stderr = await proc.communicate()
+    finally:
+        # The event loop is reused, restore the default signal handling
+        for sig in signals:
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(sig)
+        if not in_main_thread:
+            with _WORKER_PROCESSES_LOCK:
+                _WORKER_PROCESSES.discard(proc)
     if TYPE_CHECKING:
         assert proc.returncode
     returncode: int = proc.returncode
-    result: subprocess.CompletedProcess[bytes] = subprocess.CompletedProcess(
+    return subprocess.CompletedProcess(
         args=cmdline,
         stdout=proc_stdout,
         stderr=proc_stderr,
         returncode=returncode,
     )
-    future.set_result(result)
+
+
+def terminate_worker_processes() -> None:
+    """
+    Terminate the processes started from worker threads which are still running.
+    """
+    with _WORKER_PROCESSES_LOCK:
+        procs = list(_WORKER_PROCESSES)
+    for proc in procs:
+        with contextlib.suppress(ProcessLookupError):
+            proc.terminate()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the main thread's event loop used to run subprocesses, creating it on the first call.
+    """
+    global _LOOP  # noqa: PLW0603
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = _new_event_loop()
+        # Only our own coroutines run on this loop, none of them are async generators
+        atexit.register(_LOOP.close)
+    return _LOOP
 
 
 def run(
@@ -267,24 +342,25 @@ def run(
     """
     Run a command.
     """
-    loop = asyncio.new_event_loop()
-    future = loop.create_future()
-    try:
-        loop.run_until_complete(
-            _subprocess_run(
-                future=future,
-                cmdline=cmdline,
-                timeout_secs=timeout_secs,
-                no_output_timeout_secs=no_output_timeout_secs,
-                capture=capture,
-                interactive=interactive,
-                **kwargs,
-            )
-        )
-        result = future.result()
-        if check is True:
-            result.check_returncode()
-        return cast(subprocess.CompletedProcess[bytes], result)
-    finally:
-        loop.run_until_complete(loop.shutdown_asyncgens())
-        loop.close()
+    coro = _subprocess_run(
+        cmdline=cmdline,
+        timeout_secs=timeout_secs,
+        no_output_timeout_secs=no_output_timeout_secs,
+        capture=capture,
+        interactive=interactive,
+        **kwargs,
+    )
+    if threading.current_thread() is threading.main_thread():
+        result = _get_loop().run_until_complete(coro)
+    else:
+        # Worker threads come and go, use a loop which is closed right away so that
+        # nothing is left behind when the thread exits. uvloop loops in several threads
+        # can't spawn processes concurrently, always use the stdlib loop here.
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    if check is True:
+        result.check_returncode()
+    return result
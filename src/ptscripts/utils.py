@@ -1,9 +1,31 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
 import hashlib
+import json
+import mmap
+import os
 import pathlib
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import cast
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The digests cache file is named after this algorithm, changing it starts a new cache
+_DIGEST_ALGORITHM = "blake2b"
+# Files modified this recently could still change without their size or mtime changing,
+# given the filesystems timestamps granularity, see ``is_recently_modified()``
+_RECENTLY_MODIFIED_WINDOW_NS = 2 * 10**9
+_DIGESTS_CACHE: dict[str, list[Any]] | None = None
+_DIGESTS_CACHE_LOCK = threading.Lock()
+# Below this total size of files to digest, a thread pool costs more than it saves
+_PARALLEL_DIGESTS_MIN_SIZE = 4 * 1024**2
+
 
 def cast_to_pathlib_path(value: str | pathlib.Path) -> pathlib.Path:
     """
@@ -14,21 +36,134 @@ def cast_to_pathlib_path(value: str | pathlib.Path) -> pathlib.Path:
     return pathlib.Path(str(value))
 
 
+def is_recently_modified(stat: os.stat_result) -> bool:
+    """
+    Check if a file was modified too recently for its modification time to be trusted.
+
+    A later change could still leave both its modification time and its size untouched.
+    """
+    return time.time_ns() - stat.st_mtime_ns <= _RECENTLY_MODIFIED_WINDOW_NS
+
+
 def file_digest(path: pathlib.Path) -> bytes:
     """
-    Return a SHA256 digest of a file.
+    Return a BLAKE2b digest of a file.
     """
     with path.open("rb") as rfh:
         try:
-            digest = hashlib.file_digest(rfh, "sha256")  # type: ignore[attr-defined]
+            digest = hashlib.file_digest(rfh, _DIGEST_ALGORITHM)  # type: ignore[attr-defined]
         except AttributeError:
             # Python < 3.11
-            buf = bytearray(2**18)  # Reusable buffer to reduce allocations.
-            view = memoryview(buf)
-            digest = hashlib.sha256()
-            while True:
-                size = rfh.readinto(buf)
-                if size == 0:
-                    break  # EOF
-                digest.update(view[:size])
+            digest = hashlib.new(_DIGEST_ALGORITHM)
+            # Empty files can't be memory mapped
+            if os.fstat(rfh.fileno()).st_size:
+                with mmap.mmap(rfh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
     return cast(bytes, digest.digest())
+
+
+def _write_digests_cache(path: pathlib.Path, original: dict[str, list[Any]]) -> None:
+    """
+    Persist the file digests cache, if it changed, dropping the entries of removed files.
+    """
+    if _DIGESTS_CACHE is None or original == _DIGESTS_CACHE:
+        return
+    # Only pruned when it has to be written anyway, that's a stat call per entry
+    cache = {key: entry for key, entry in _DIGESTS_CACHE.items() if pathlib.Path(key).exists()}
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that the cache is replaced atomically
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}")
+        tmp_path.write_text(json.dumps(cache))
+        tmp_path.replace(path)
+
+
+def _get_digests_cache() -> dict[str, list[Any]]:
+    """
+    Return the file digests cache, loading it on the first call.
+    """
+    global _DIGESTS_CACHE  # noqa: PLW0603
+    with _DIGESTS_CACHE_LOCK:
+        if _DIGESTS_CACHE is None:
+            # Late import to avoid circular import errors
+            from ptscripts.__main__ import TOOLS_VENVS_PATH
+
+            path = TOOLS_VENVS_PATH / f".hash-cache.{_DIGEST_ALGORITHM}.json"
+            try:
+                _DIGESTS_CACHE = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                _DIGESTS_CACHE = None
+            if not isinstance(_DIGESTS_CACHE, dict):
+                _DIGESTS_CACHE = {}
+            atexit.register(_write_digests_cache, path, dict(_DIGESTS_CACHE))
+        return _DIGESTS_CACHE
+
+
+def _get_cached_digest(key: str, stat: os.stat_result) -> bytes | None:
+    """
+    Return the cached digest of a file, if its modification time and size didn't change.
+    """
+    entry = _get_digests_cache().get(key)
+    if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+        return bytes.fromhex(entry[2])
+    return None
+
+
+def _cache_digest(key: str, stat: os.stat_result, digest: bytes) -> None:
+    """
+    Cache the digest of a file, unless it was modified too recently to be trusted.
+    """
+    if not is_recently_modified(stat):
+        _get_digests_cache()[key] = [stat.st_mtime_ns, stat.st_size, digest.hex()]
+
+
+def cached_file_digest(path: pathlib.Path) -> bytes:
+    """
+    Return a BLAKE2b digest of a file, cached by the file's modification time and size.
+
+    The cache is persisted across runs under the tools virtualenvs path.
+    """
+    stat = path.stat()
+    key = str(path.absolute())
+    digest = _get_cached_digest(key, stat)
+    if digest is None:
+        digest = file_digest(path)
+        _cache_digest(key, stat, digest)
+    return digest
+
+
+def file_digests(paths: Sequence[pathlib.Path]) -> list[bytes]:
+    """
+    Return the cached digests of the passed files, in the same order.
+
+    Cache misses adding up to a large enough size are digested concurrently, since
+    ``hashlib`` releases the GIL while hashing. Otherwise, starting a thread pool costs
+    more than it saves.
+    """
+    digests: list[bytes | None] = []
+    misses: list[tuple[int, pathlib.Path, str, os.stat_result]] = []
+    for path in paths:
+        stat = path.stat()
+        key = str(path.absolute())
+        digest = _get_cached_digest(key, stat)
+        if digest is None:
+            misses.append((len(digests), path, key, stat))
+        digests.append(digest)
+
+    missed_paths = [path for _, path, _, _ in misses]
+    if (
+        len(misses) > 1
+        and sum(stat.st_size for _, _, _, stat in misses) >= _PARALLEL_DIGESTS_MIN_SIZE
+    ):
+        # Late import to only load the thread pool machinery when it's actually used
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+            missed_digests = list(executor.map(file_digest, missed_paths))
+    else:
+        missed_digests = [file_digest(path) for path in missed_paths]
+
+    for (index, _, key, stat), digest in zip(misses, missed_digests):
+        _cache_digest(key, stat, digest)
+        digests[index] = digest
+    return cast("list[bytes]", digests)
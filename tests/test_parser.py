@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pathlib
+from typing import Any
+
+import pytest
+
+from ptscripts.parser import CommandGroup
+from ptscripts.parser import Context
+from ptscripts.parser import Parser
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    # The decorated functions are expected to be defined under the repository root
+    monkeypatch.chdir(pathlib.Path(__file__).resolve().parent.parent)
+    return Parser()
+
+
+@pytest.fixture
+def group(parser):
+    return CommandGroup("grp", "Group", parent=parser)
+
+
+def test_command_arguments_not_in_signature(group):
+    with pytest.raises(RuntimeError, match="'cuont' is not present"):
+
+        @group.command(arguments={"cuont": {"help": "Count"}})
+        def hello(ctx: Context, count: int = 1) -> None:
+            pass
+
+
+def test_command_arguments_missing(group):
+    with pytest.raises(RuntimeError, match="'arguments' is a mandatory keyword argument"):
+
+        @group.command
+        def hello(ctx: Context, count: int = 1) -> None:
+            pass
+
+
+def test_command_ctx_not_first(group):
+    with pytest.raises(RuntimeError, match="'ctx' is a mandatory first argument"):
+
+        @group.command(arguments={"count": {"help": "Count"}})
+        def hello(count: int, ctx: Context) -> None:
+            pass
+
+
+def test_command_dispatch(parser, group):
+    calls: list[Any] = []
+
+    @group.command(arguments={"name": {"help": "Name"}, "count": {"help": "Count"}})
+    def hello(ctx: Context, name: str, count: int = 1) -> None:
+        calls.append((name, count))
+
+    @group.command(arguments={"loud": {"help": "Loud"}})
+    def bye(ctx: Context, loud: bool = False) -> None:
+        calls.append(loud)
+
+    options = parser.parser.parse_args(["grp", "hello", "world", "--count", "3"])
+    options.func(options)
+    assert calls == [("world", 3)]
+    # Only the selected command parser was setup
+    assert group.subparsers.choices["bye"]._deferred_setup is not None  # noqa: SLF001
+
+    options = parser.parser.parse_args(["grp", "bye", "--loud"])
+    options.func(options)
+    assert calls == [("world", 3), True]
+
+
+def test_command_help(parser, group, capsys):
+    @group.command(arguments={"count": {"help": "How many times"}})
+    def hello(ctx: Context, count: int = 1) -> None:
+        """
+        Say hello.
+        """
+
+    with pytest.raises(SystemExit) as exc:
+        parser.parser.parse_args(["grp", "--help"])
+    assert exc.value.code == 0
+    assert "Say hello." in capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as exc:
+        parser.parser.parse_args(["grp", "hello", "--help"])
+    assert exc.value.code == 0
+    assert "How many times. [default: 1]" in capsys.readouterr().out
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import time
+from functools import partial
+from unittest import mock
+
+import pytest
+
+import ptscripts.__main__
+from ptscripts import utils
+
+# Old enough for the files modification times to be trusted
+AN_HOUR_AGO = time.time() - 3600
+
+
+@pytest.fixture
+def new_run(tmp_path, monkeypatch):
+    """
+    Return a function persisting the digests cache, like on exit, and starting a new run.
+    """
+    monkeypatch.setattr(ptscripts.__main__, "TOOLS_VENVS_PATH", tmp_path / "venvs")
+    monkeypatch.setattr(utils, "_DIGESTS_CACHE", None)
+    exit_callbacks = []
+    monkeypatch.setattr(
+        atexit, "register", lambda func, *args: exit_callbacks.append(partial(func, *args))
+    )
+
+    def _new_run() -> None:
+        while exit_callbacks:
+            exit_callbacks.pop()()
+        utils._DIGESTS_CACHE = None  # noqa: SLF001
+
+    return _new_run
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "venvs" / ".hash-cache.blake2b.json"
+
+
+def _write_file(path, contents, mtime=AN_HOUR_AGO):
+    path.write_text(contents)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cached_file_digest_hit(tmp_path, new_run, cache_path):
+    path = _write_file(tmp_path / "foo.txt", "foo")
+    assert utils.cached_file_digest(path) == hashlib.blake2b(b"foo").digest()
+    new_run()
+    assert str(path) in json.loads(cache_path.read_text())
+    with mock.patch.object(utils, "file_digest") as file_digest:
+        assert utils.cached_file_digest(path) == hashlib.blake2b(b"foo").digest()
+    file_digest.assert_not_called()
+
+
+def test_cached_file_digest_modified_file(tmp_path, new_run):
+    path = _write_file(tmp_path / "foo.txt", "foo")
+    utils.cached_file_digest(path)
+    new_run()
+    # Same size, only the modification time tells the change apart
+    _write_file(path, "bar", mtime=AN_HOUR_AGO + 60)
+    assert utils.cached_file_digest(path) == hashlib.blake2b(b"bar").digest()
+
+
+def test_cached_file_digest_recently_modified_file_not_cached(tmp_path, new_run, cache_path):
+    path = tmp_path / "foo.txt"
+    path.write_text("foo")
+    assert utils.cached_file_digest(path) == hashlib.blake2b(b"foo").digest()
+    new_run()
+    assert not cache_path.exists()
+
+
+def test_digests_cache_prunes_removed_files(tmp_path, new_run, cache_path):
+    foo = _write_file(tmp_path / "foo.txt", "foo")
+    bar = _write_file(tmp_path / "bar.txt", "bar")
+    utils.file_digests([foo, bar])
+    new_run()
+    bar.unlink()
+    baz = _write_file(tmp_path / "baz.txt", "baz")
+    utils.cached_file_digest(baz)
+    new_run()
+    assert sorted(json.loads(cache_path.read_text())) == [str(baz), str(foo)]
+
+
+def test_digests_cache_not_written_when_unchanged(tmp_path, new_run, cache_path):
+    path = _write_file(tmp_path / "foo.txt", "foo")
+    utils.cached_file_digest(path)
+    new_run()
+    os.utime(cache_path, (AN_HOUR_AGO, AN_HOUR_AGO))
+    utils.cached_file_digest(path)
+    # Nor are the cached entries checked for removed files
+    with mock.patch("pathlib.Path.exists") as exists:
+        new_run()
+    exists.assert_not_called()
+    assert cache_path.stat().st_mtime == AN_HOUR_AGO
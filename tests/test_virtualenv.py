@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import site
+import sys
+import time
+from unittest import mock
+
+import pytest
+
+import ptscripts.__main__
+from ptscripts import process
+from ptscripts import utils
+from ptscripts.models import VirtualEnvPipConfig
+from ptscripts.virtualenv import VirtualEnv
+
+PROC_FDS_PATH = pathlib.Path("/proc/self/fd")
+# Old enough for the requirements files modification times to be trusted
+AN_HOUR_AGO = time.time() - 3600
+
+
+@pytest.fixture
+def requirements_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(ptscripts.__main__, "TOOLS_VENVS_PATH", tmp_path / "venvs")
+    # Don't load, nor persist, the file digests cache
+    monkeypatch.setattr(utils, "_DIGESTS_CACHE", {})
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("foo\n")
+    os.utime(requirements_file, (AN_HOUR_AGO, AN_HOUR_AGO))
+    return requirements_file
+
+
+@pytest.fixture
+def installs(requirements_file, monkeypatch):
+    installs = []
+    monkeypatch.setattr(
+        VirtualEnvPipConfig,
+        "install",
+        lambda *_, **__: installs.append(requirements_file.read_text()),
+    )
+    return installs
+
+
+def _install_requirements(requirements_file: pathlib.Path) -> None:
+    # A new instance each time, like on each tools run
+    venv = VirtualEnv(
+        ctx=mock.MagicMock(),
+        config=VirtualEnvPipConfig(name="venv", requirements_files=[requirements_file]),
+    )
+    venv.venv_dir.mkdir(exist_ok=True)
+    venv._install_requirements()  # noqa: SLF001
+
+
+def _open_fds_count() -> int:
+    return len(os.listdir(PROC_FDS_PATH))
+
+
+@pytest.mark.skipif(not PROC_FDS_PATH.is_dir(), reason="Needs /proc/self/fd to count open fds")
+def test_prepare_many_does_not_leak_file_descriptors(monkeypatch):
+    def _prepare(self):
+        process.run(sys.executable, "-c", "pass", capture=True)
+
+    monkeypatch.setattr(VirtualEnv, "_prepare", _prepare)
+    venvs = [
+        VirtualEnv(
+            ctx=mock.MagicMock(),
+            config=VirtualEnvPipConfig(name=f"venv-{idx}", require_lock=False),
+        )
+        for idx in range(8)
+    ]
+    # Pytest's captured stdin has no file descriptor to hand over to the subprocesses
+    with open(os.devnull) as stdin:  # noqa: PTH123
+        monkeypatch.setattr(sys, "stdin", stdin)
+        VirtualEnv.prepare_many(venvs)
+        open_fds_count = _open_fds_count()
+        for _ in range(5):
+            VirtualEnv.prepare_many(venvs)
+        assert _open_fds_count() == open_fds_count
+
+
+def test_prepare_many_interrupted_terminates_subprocesses(monkeypatch):
+    def _prepare(self):
+        if self.config.name == "interrupted":
+            time.sleep(0.5)
+            raise KeyboardInterrupt
+        process.run(sys.executable, "-c", "import time; time.sleep(30)", capture=True)
+
+    monkeypatch.setattr(VirtualEnv, "_prepare", _prepare)
+    venvs = [
+        VirtualEnv(
+            ctx=mock.MagicMock(),
+            config=VirtualEnvPipConfig(name=name, require_lock=False),
+        )
+        for name in ("interrupted", "long-running")
+    ]
+    start = time.monotonic()
+    with open(os.devnull) as stdin:  # noqa: PTH123
+        monkeypatch.setattr(sys, "stdin", stdin)
+        with pytest.raises(KeyboardInterrupt):
+            VirtualEnv.prepare_many(venvs)
+    # The long running subprocess was terminated instead of waited for
+    assert time.monotonic() - start < 10
+    assert not process._WORKER_PROCESSES  # noqa: SLF001
+
+
+def test_install_requirements_skipped_when_inputs_unchanged(installs, requirements_file):
+    _install_requirements(requirements_file)
+    assert installs == ["foo\n"]
+    with mock.patch("ptscripts.models.file_digests") as file_digests:
+        _install_requirements(requirements_file)
+    # The requirements files were not even hashed
+    file_digests.assert_not_called()
+    assert installs == ["foo\n"]
+
+    # Only touched, the requirements hash is compared but nothing is installed
+    os.utime(requirements_file, (AN_HOUR_AGO + 60, AN_HOUR_AGO + 60))
+    with mock.patch("ptscripts.models.file_digests", wraps=utils.file_digests) as file_digests:
+        _install_requirements(requirements_file)
+    file_digests.assert_called()
+    assert installs == ["foo\n"]
+
+    requirements_file.write_text("bar\n")
+    os.utime(requirements_file, (AN_HOUR_AGO + 120, AN_HOUR_AGO + 120))
+    _install_requirements(requirements_file)
+    assert installs == ["foo\n", "bar\n"]
+
+
+def test_install_requirements_recently_modified_inputs_are_hashed(installs, requirements_file):
+    requirements_file.write_text("bar\n")
+    _install_requirements(requirements_file)
+    assert installs == ["bar\n"]
+    # Too recent for its modification time to be trusted, the contents are hashed again
+    with mock.patch("ptscripts.models.file_digests", wraps=utils.file_digests) as file_digests:
+        _install_requirements(requirements_file)
+    file_digests.assert_called()
+    assert installs == ["bar\n"]
+
+
+def test_install_requirements_changed_during_install(installs, requirements_file, monkeypatch):
+    def _install(*_, **__):
+        installs.append(requirements_file.read_text())
+        if len(installs) == 1:
+            # Edited while installing, with a modification time older than the hash file
+            requirements_file.write_text("bar\n")
+            os.utime(requirements_file, (AN_HOUR_AGO + 60, AN_HOUR_AGO + 60))
+
+    monkeypatch.setattr(VirtualEnvPipConfig, "install", _install)
+    _install_requirements(requirements_file)
+    _install_requirements(requirements_file)
+    assert installs == ["foo\n", "bar\n"]
+
+
+@pytest.mark.parametrize("system_site_packages", [False, True])
+def test_site_packages_created_by_running_python(tmp_path, monkeypatch, system_site_packages):
+    monkeypatch.setattr(ptscripts.__main__, "TOOLS_VENVS_PATH", tmp_path)
+    venv = VirtualEnv(ctx=mock.MagicMock(), config=VirtualEnvPipConfig(name="venv"))
+    venv.venv_dir.mkdir()
+    venv.venv_dir.joinpath("pyvenv.cfg").write_text(
+        f"home = {pathlib.Path(sys.executable).parent}\n"
+        f"include-system-site-packages = {str(system_site_packages).lower()}\n"
+        "version = {}.{}.{}\n".format(*sys.version_info)
+    )
+    site_packages = ["/base/site-packages", "/venv/site-packages"]
+    with mock.patch.object(
+        VirtualEnv,
+        "run_code",
+        return_value=mock.Mock(returncode=0, stdout=json.dumps(site_packages)),
+    ) as run_code:
+        if system_site_packages:
+            # Only the virtualenv's python reports the base interpreter's site packages too
+            assert venv._site_packages == site_packages  # noqa: SLF001
+            run_code.assert_called_once()
+        else:
+            assert venv._site_packages == site.getsitepackages([str(venv.venv_dir)])  # noqa: SLF001
+            run_code.assert_not_called()